@@ -13,14 +13,10 @@ import contentcuration.models as models
 
 
 def write_file_to_storage(fobj, check_valid=False, name=None):
-    fobj.seek(0)  # Make sure reading file from beginning
     # Check that hash is valid
-    checksum = hashlib.md5()
-    for chunk in iter(lambda: fobj.read(4096), b""):
-        checksum.update(chunk)
+    hashed_filename, _ = models.calculate_md5(fobj)
     name = name or fobj._name or ""
     filename, ext = os.path.splitext(name)
-    hashed_filename = checksum.hexdigest()
     full_filename = "{}{}".format(hashed_filename, ext.lower())
     fobj.seek(0)
 
@@ -60,8 +56,6 @@ def write_raw_content_to_storage(contents, ext=None):
 
 
 def get_hash(fobj):
-    md5 = hashlib.md5()
-    for chunk in fobj.chunks():
-        md5.update(chunk)
+    checksum, _ = models.calculate_md5(fobj)
     fobj.seek(0)
-    return md5.hexdigest()
+    return checksum
@@ -16,6 +16,7 @@ from contentcuration.constants.locking import TREE_LOCK
 from contentcuration.db.advisory_lock import advisory_lock
 from contentcuration.db.models.query import CustomTreeQuerySet
 from contentcuration.utils.cache import ResourceSizeCache
+from contentcuration.utils.ordered_uuid import uuid7
 
 
 logging = logger.getLogger(__name__)
@@ -272,7 +273,7 @@ class CustomContentNodeTreeManager(TreeManager.from_queryset(CustomTreeQuerySet)
         self, source, parent_id, source_channel_id, can_edit_source_channel, pk, mods
     ):
         copy = {
-            "id": pk or uuid.uuid4().hex,
+            "id": pk or uuid7().hex,
             "node_id": uuid.uuid4().hex,
             "aggregator": source.aggregator,
             "cloned_source": source,
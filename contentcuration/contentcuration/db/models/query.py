@@ -1,10 +1,14 @@
 from django.db import connections
+from django.db.models import Exists
+from django.db.models import OuterRef
+from django.db.models import Prefetch
 from django.db.models.expressions import Col
 from django.db.models.sql.compiler import SQLCompiler
 from django.db.models.sql.constants import INNER
 from django.db.models.sql.query import Query
 from django_cte import CTEQuerySet
 from django_cte import With as CTEWith
+from le_utils.constants import content_kinds
 from mptt.querysets import TreeQuerySet
 
 
@@ -12,7 +16,28 @@ RIGHT_JOIN = 'RIGHT JOIN'
 
 
 class CustomTreeQuerySet(TreeQuerySet, CTEQuerySet):
-    pass
+    def with_related(self):
+        """
+        Eagerly loads the relations that are read for every node when walking over a tree,
+        so that iterating the queryset does not issue a query per node for each of them.
+        """
+        from contentcuration.models import ContentTag
+
+        return self.select_related("kind", "license", "language").prefetch_related(
+            Prefetch("tags", queryset=ContentTag.objects.only("id", "tag_name"))
+        )
+
+    def with_publishable(self):
+        """
+        Annotates whether each node or one of its descendants is a resource, which
+        ContentNode.is_publishable then reads instead of running an EXISTS query per node.
+        """
+        resources = self.model.objects.filter(
+            tree_id=OuterRef("tree_id"),
+            lft__gte=OuterRef("lft"),
+            rght__lte=OuterRef("rght"),
+        ).exclude(kind_id=content_kinds.TOPIC)
+        return self.annotate(has_resources=Exists(resources))
 
 
 class With(CTEWith):
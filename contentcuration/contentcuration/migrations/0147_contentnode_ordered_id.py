@@ -0,0 +1,20 @@
+# Generated by Django 3.2.23 on 2026-10-15 12:00
+from django.db import migrations
+
+import contentcuration.models
+import contentcuration.utils.ordered_uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contentcuration', '0146_drop_taskresult_fields'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='contentnode',
+            name='id',
+            field=contentcuration.models.UUIDField(default=contentcuration.utils.ordered_uuid.uuid7, max_length=32, primary_key=True, serialize=False),
+        ),
+    ]
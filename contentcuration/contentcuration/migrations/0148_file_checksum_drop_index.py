@@ -0,0 +1,18 @@
+# Generated by Django 3.2.23 on 2026-10-15 12:00
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contentcuration', '0147_contentnode_ordered_id'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='file',
+            name='checksum',
+            field=models.CharField(blank=True, max_length=400),
+        ),
+    ]
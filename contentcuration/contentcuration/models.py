@@ -2,9 +2,11 @@ import hashlib
 import json
 import logging
 import os
+import re
 import urllib.parse
 import uuid
 from datetime import datetime
+from io import UnsupportedOperation
 
 import pytz
 from django.conf import settings
@@ -17,6 +19,7 @@ from django.core.exceptions import MultipleObjectsReturned
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.exceptions import PermissionDenied
 from django.core.exceptions import ValidationError
+from django.core.files.move import file_move_safe
 from django.core.files.storage import default_storage
 from django.core.files.storage import FileSystemStorage
 from django.core.mail import send_mail
@@ -24,6 +27,7 @@ from django.core.validators import MaxValueValidator
 from django.core.validators import MinValueValidator
 from django.db import IntegrityError
 from django.db import models
+from django.db import transaction
 from django.db.models import Count
 from django.db.models import Exists
 from django.db.models import F
@@ -72,8 +76,10 @@ from contentcuration.db.models.functions import ArrayRemove
 from contentcuration.db.models.functions import Unnest
 from contentcuration.db.models.manager import CustomContentNodeTreeManager
 from contentcuration.db.models.manager import CustomManager
+from contentcuration.decorators import delay_user_storage_calculation
 from contentcuration.statistics import record_channel_stats
 from contentcuration.utils.cache import delete_public_channel_cache_keys
+from contentcuration.utils.ordered_uuid import uuid7
 from contentcuration.utils.parser import load_json_string
 from contentcuration.viewsets.sync.constants import ALL_CHANGES
 from contentcuration.viewsets.sync.constants import ALL_TABLES
@@ -523,6 +529,37 @@ def generate_file_on_disk_name(checksum, filename):
     return os.path.join(directory, h + ext.lower())
 
 
+# Size of the reusable buffer used when hashing file contents
+HASH_BUFFER_SIZE = 1024 * 1024
+
+
+def calculate_md5(fobj):
+    """
+    Hash the contents of a file object from the beginning, reading into a single reusable
+    buffer so large files do not allocate a new bytes object per chunk.
+    :param fobj: file-like object
+    :return: tuple of (md5 hex digest, number of bytes read)
+    """
+    try:
+        fobj.seek(0)
+    except (AttributeError, UnsupportedOperation):
+        pass
+
+    md5 = hashlib.md5()
+    size = 0
+    readinto = getattr(fobj, "readinto", None)
+    if readinto is not None:
+        view = memoryview(bytearray(HASH_BUFFER_SIZE))
+        for read in iter(lambda: readinto(view), 0):
+            md5.update(view[:read])
+            size += read
+    else:
+        for chunk in iter(lambda: fobj.read(HASH_BUFFER_SIZE), b""):
+            md5.update(chunk)
+            size += len(chunk)
+    return md5.hexdigest(), size
+
+
 def object_storage_name(instance, filename):
     """
     Create a name spaced file path from the File obejct's checksum property.
@@ -607,11 +644,46 @@ class FileOnDiskStorage(FileSystemStorage):
         return name
 
     def _save(self, name, content):
-        if self.exists(name):
-            # if the file exists, do not call the superclasses _save method
+        full_path = self.path(name)
+        self._make_directory(os.path.dirname(full_path))
+        # Create the file exclusively, so that checking for an existing copy and creating
+        # a new one is a single filesystem operation rather than a stat followed by an open
+        try:
+            if hasattr(content, 'temporary_file_path'):
+                file_move_safe(content.temporary_file_path(), full_path)
+            else:
+                self._write_new_file(full_path, content)
+        except FileExistsError:
             logging.warn('Content copy "%s" already exists!' % name)
             return name
-        return super(FileOnDiskStorage, self)._save(name, content)
+        if self.file_permissions_mode is not None:
+            os.chmod(full_path, self.file_permissions_mode)
+        return name
+
+    def _make_directory(self, directory):
+        if self.directory_permissions_mode is None:
+            os.makedirs(directory, exist_ok=True)
+            return
+        # set the umask so that makedirs applies the exact mode to any directories it creates
+        old_umask = os.umask(0o777 & ~self.directory_permissions_mode)
+        try:
+            os.makedirs(directory, self.directory_permissions_mode, exist_ok=True)
+        finally:
+            os.umask(old_umask)
+
+    def _write_new_file(self, full_path, content):
+        fd = os.open(full_path, self.OS_OPEN_FLAGS, 0o666)
+        _file = None
+        try:
+            for chunk in content.chunks():
+                if _file is None:
+                    _file = os.fdopen(fd, 'wb' if isinstance(chunk, bytes) else 'wt')
+                _file.write(chunk)
+        finally:
+            if _file is not None:
+                _file.close()
+            else:
+                os.close(fd)
 
 
 class SecretToken(models.Model):
@@ -949,11 +1021,14 @@ class Channel(models.Model):
 
     def save(self, *args, **kwargs):
         if self._state.adding:
-            self.on_create()
+            # Create the trees in the same transaction as the channel, so that
+            # a failure to save the channel does not leave orphaned trees behind
+            with transaction.atomic():
+                self.on_create()
+                super(Channel, self).save(*args, **kwargs)
         else:
             self.on_update()
-
-        super(Channel, self).save(*args, **kwargs)
+            super(Channel, self).save(*args, **kwargs)
 
     def get_thumbnail(self):
         return get_channel_thumbnail(self)
@@ -1157,6 +1232,22 @@ class ContentTag(models.Model):
     def __str__(self):
         return self.tag_name
 
+    @classmethod
+    def bulk_upsert(cls, channel, names):
+        """
+        Get or create the tags with the given names for a channel in a fixed number of queries
+        :param channel: the Channel the tags belong to, or None
+        :param names: an iterable of tag names
+        :return: a queryset of the tags
+        """
+        names = set(names)
+        existing = set(cls.objects.filter(channel=channel, tag_name__in=names).values_list("tag_name", flat=True))
+        cls.objects.bulk_create(
+            [cls(channel=channel, tag_name=name) for name in names - existing],
+            ignore_conflicts=True,
+        )
+        return cls.objects.filter(channel=channel, tag_name__in=names)
+
     class Meta:
         unique_together = ['tag_name', 'channel']
 
@@ -1196,7 +1287,8 @@ class ContentNode(MPTTModel, models.Model):
     By default, all nodes have a title and can be used as a topic.
     """
     # Random id used internally on Studio (See `node_id` for id used in Kolibri)
-    id = UUIDField(primary_key=True, default=uuid.uuid4)
+    # Time-ordered so that server-created nodes append to the primary key index
+    id = UUIDField(primary_key=True, default=uuid7)
 
     # the content_id is used for tracking a user's interaction with a piece of
     # content, in the face of possibly many copies of that content. When a user
@@ -1939,16 +2031,20 @@ class ContentNode(MPTTModel, models.Model):
     save.alters_data = True
 
     def delete(self, *args, **kwargs):
-        parent = self.parent or self._field_updates.changed().get('parent')
-        if parent:
-            parent.changed = True
-            parent.save()
-
-        self.recalculate_editors_storage()
+        # Flag the parent as changed with a single UPDATE, rather than fetching
+        # the parent and re-saving every one of its columns
+        parent_id = self.parent_id or to_pk(self._field_updates.changed().get('parent'))
+        if parent_id:
+            ContentNode.objects.filter(id=parent_id).update(changed=True)
+
+        # Deleting the node cascades to its files, each of which triggers a storage recalculation
+        # for its uploader, so batch those into a single recalculation per user
+        with delay_user_storage_calculation:
+            self.recalculate_editors_storage()
 
-        # Lock the mptt fields for the tree of this node
-        with ContentNode.objects.lock_mptt(self.tree_id):
-            return super(ContentNode, self).delete(*args, **kwargs)
+            # Lock the mptt fields for the tree of this node
+            with ContentNode.objects.lock_mptt(self.tree_id):
+                return super(ContentNode, self).delete(*args, **kwargs)
 
     # Copied from MPTT
     delete.alters_data = True
@@ -1970,7 +2066,12 @@ class ContentNode(MPTTModel, models.Model):
         return self.copy_to()
 
     def is_publishable(self):
-        return self.complete and self.get_descendants(include_self=True).exclude(kind_id=content_kinds.TOPIC).exists()
+        if not self.complete:
+            return False
+        # use the annotation from the `with_publishable` queryset method when present
+        if hasattr(self, "has_resources"):
+            return self.has_resources
+        return self.get_descendants(include_self=True).exclude(kind_id=content_kinds.TOPIC).exists()
 
     class Meta:
         verbose_name = "Topic"
@@ -2177,6 +2278,8 @@ class StagedFile(models.Model):
     uploaded_by = models.ForeignKey(User, related_name='staged_files', blank=True, null=True, on_delete=models.CASCADE)
 
 
+# Matches the `<md5>.<ext>` names of content-addressed files
+CHECKSUM_FILENAME_RE = re.compile(r"^([0-9a-f]{32})\.\w+$")
 FILE_DISTINCT_INDEX_NAME = "file_checksum_file_size_idx"
 FILE_MODIFIED_DESC_INDEX_NAME = "file_modified_desc_idx"
 FILE_DURATION_CONSTRAINT = "file_media_duration_int"
@@ -2195,7 +2298,8 @@ class File(models.Model):
     Things it can represent are, for example, mp4, avi, mov, html, css, jpeg, pdf, mp3...
     """
     id = UUIDField(primary_key=True, default=uuid.uuid4)
-    checksum = models.CharField(max_length=400, blank=True, db_index=True)
+    # checksum lookups are served by the (checksum, file_size) index in Meta
+    checksum = models.CharField(max_length=400, blank=True)
     file_size = models.IntegerField(blank=True, null=True)
     file_on_disk = models.FileField(upload_to=object_storage_name, storage=default_storage, max_length=500,
                                     blank=True)
@@ -2297,6 +2401,28 @@ class File(models.Model):
         self.modified = timezone.now()
         self.update_contentnode_content_id()
 
+    def set_checksum_from_file_on_disk(self):
+        """
+        Hash the content copy to set the checksum, unless its filename is already its checksum
+        and clients are trusted to have computed it
+        """
+        match = settings.TRUST_CLIENT_CHECKSUMS and CHECKSUM_FILENAME_RE.match(os.path.basename(self.file_on_disk.name))
+        if match:
+            self.checksum = match.group(1)
+        else:
+            self.checksum, size = calculate_md5(self.file_on_disk)
+            self.file_size = self.file_size or size
+
+    def use_stored_copy(self):
+        """
+        Storage is addressed by checksum, so when a copy of the uploaded file is already stored,
+        point at it rather than uploading the same content again
+        """
+        storage_name = self.file_on_disk.field.generate_filename(self, self.file_on_disk.name)
+        if self.file_on_disk.storage.exists(storage_name):
+            self.file_on_disk.name = storage_name
+            self.file_on_disk._committed = True
+
     def save(self, set_by_file_on_disk=True, *args, **kwargs):
         """
         Overrider the default save method.
@@ -2313,11 +2439,7 @@ class File(models.Model):
 
         if set_by_file_on_disk and self.file_on_disk:  # if file_on_disk is supplied, hash out the file
             if self.checksum is None or self.checksum == "":
-                md5 = hashlib.md5()
-                for chunk in self.file_on_disk.chunks():
-                    md5.update(chunk)
-
-                self.checksum = md5.hexdigest()
+                self.set_checksum_from_file_on_disk()
             if not self.file_size:
                 self.file_size = self.file_on_disk.size
             if not self.file_format_id:
@@ -2326,6 +2448,8 @@ class File(models.Model):
                     self.file_format_id = ext
                 else:
                     raise ValueError("Files of type `{}` are not supported.".format(ext))
+            if not self.file_on_disk._committed:
+                self.use_stored_copy()
 
         super(File, self).save(*args, **kwargs)
 
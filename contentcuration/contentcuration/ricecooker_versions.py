@@ -1,14 +1,12 @@
-from future import standard_library
-
-standard_library.install_aliases()
-
-
 """
 Latest ricecooker version
 Any version >= VERSION_OK will get a message that
 the version is "up to date" (log level = info)
+
+This is a pinned constant rather than a lookup against PyPI, so importing this
+module never makes a network request; bump it when a new ricecooker is released.
 """
-VERSION_OK = "0.6.32"  # this gets overwritten to current v. after XML RPC call
+VERSION_OK = "0.6.32"
 VERSION_OK_MESSAGE = "Ricecooker v{} is up-to-date."
 
 """
@@ -393,6 +393,11 @@ AWS_S3_BUCKET_AUTH = False
 # for how these credentials are inferred automatically.
 GCS_STORAGE_SERVICE_ACCOUNT_KEY_PATH = os.getenv("GOOGLE_CLOUD_STORAGE_SERVICE_ACCOUNT_CREDENTIALS")
 
+# When saving a File whose upload is named `<md5>.<ext>`, as ricecooker names its files,
+# take the checksum from the filename instead of hashing the file contents again.
+# Storage is addressed by checksum, so only enable this where uploads come from trusted clients.
+TRUST_CLIENT_CHECKSUMS = False
+
 # GOOGLE DRIVE SETTINGS
 GOOGLE_AUTH_JSON = "credentials/client_secret.json"
 GOOGLE_STORAGE_REQUEST_SHEET = "16X6zcFK8FS5t5tFaGpnxbWnWTXP88h4ccpSpPbyLeA8"
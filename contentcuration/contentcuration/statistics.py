@@ -11,22 +11,14 @@ def record_channel_stats(channel, original_values):  # noqa: C901
     if they have changed
     """
     action_attributes = dict(channel_id=channel.id, content_type='Channel')
-    # TODO: Determine the user_id when a human creates a channel
-    if channel.editors.first() is not None:
-        action_attributes['user_id'] = channel.editors.first().id
+    counted_tree = None
 
     if channel.ricecooker_version is not None:
         action_attributes['content_source'] = 'Ricecooker'
         if channel.staging_tree is not None:
             # Staging tree only exists on API calls (currently just Ricecooker)
             action_attributes['action_source'] = 'Ricecooker'
-
-            # TODO: Update to reflect new channel creation flow
-            action_attributes['channel_num_resources'] = channel.staging_tree.get_descendants().exclude(
-                kind=content_kinds.TOPIC).count()
-            action_attributes['channel_num_nodes'] = channel.staging_tree.get_descendant_count()
-            action_attributes['num_resources_added'] = action_attributes['channel_num_resources']
-            action_attributes['num_nodes_added'] = action_attributes['channel_num_nodes']
+            counted_tree = channel.staging_tree
 
             if channel.previous_tree is None:
                 action_attributes['action'] = 'Create'
@@ -38,9 +30,7 @@ def record_channel_stats(channel, original_values):  # noqa: C901
         else:
             # Ricecooker channel is being edited by user
             action_attributes['action_source'] = 'Human'
-            action_attributes['channel_num_resources'] = channel.main_tree.get_descendants().exclude(
-                kind=content_kinds.TOPIC).count()
-            action_attributes['channel_num_nodes'] = channel.main_tree.get_descendant_count()
+            counted_tree = channel.main_tree
 
             if channel.deleted:
                 action_attributes['action'] = 'Delete'
@@ -55,14 +45,7 @@ def record_channel_stats(channel, original_values):  # noqa: C901
     else:
         action_attributes['content_source'] = 'Human'
         action_attributes['action_source'] = 'Human'
-
-        if channel.main_tree:
-            action_attributes['channel_num_resources'] = channel.main_tree.get_descendants().exclude(
-                kind=content_kinds.TOPIC).count()
-            action_attributes['channel_num_nodes'] = channel.main_tree.get_descendant_count()
-        else:
-            action_attributes['channel_num_resources'] = 0
-            action_attributes['channel_num_nodes'] = 0
+        counted_tree = channel.main_tree
 
         if original_values is None:
             if channel.name:
@@ -73,6 +56,28 @@ def record_channel_stats(channel, original_values):  # noqa: C901
             action_attributes['action'] = 'Update'
             action_attributes['action_type'] = 'Metadata'
 
+    # Most saves are not recorded, so only query for the remaining attributes when they will be used
+    if 'action' not in action_attributes:
+        return
+
+    # TODO: Determine the user_id when a human creates a channel
+    user_id = channel.editors.values_list('id', flat=True).first()
+    if user_id is not None:
+        action_attributes['user_id'] = user_id
+
+    if counted_tree:
+        action_attributes['channel_num_resources'] = counted_tree.get_descendants().exclude(
+            kind=content_kinds.TOPIC).count()
+        action_attributes['channel_num_nodes'] = counted_tree.get_descendant_count()
+    else:
+        action_attributes['channel_num_resources'] = 0
+        action_attributes['channel_num_nodes'] = 0
+
+    if action_attributes['action_source'] == 'Ricecooker':
+        # TODO: Update to reflect new channel creation flow
+        action_attributes['num_resources_added'] = action_attributes['channel_num_resources']
+        action_attributes['num_nodes_added'] = action_attributes['channel_num_nodes']
+
     record_channel_action_stats(action_attributes)
 
 
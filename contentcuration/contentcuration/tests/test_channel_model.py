@@ -2,8 +2,11 @@
 from __future__ import division
 
 import json
+import uuid
 from datetime import datetime
 
+import mock
+from django.db.utils import DataError
 from django.urls import reverse_lazy
 from past.utils import old_div
 
@@ -14,6 +17,7 @@ from .testdata import channel
 from .testdata import node
 from contentcuration.models import Channel
 from contentcuration.models import ChannelSet
+from contentcuration.models import ContentNode
 from contentcuration.models import generate_storage_url
 from contentcuration.models import SecretToken
 from contentcuration.tests.utils import mixer
@@ -329,6 +333,31 @@ class ChannelMetadataSaveTestCase(StudioTestCase):
             self.assertFalse(c.main_tree.changed)
 
 
+class ChannelCreateTestCase(StudioTestCase):
+    def test_failed_create_rolls_back_trees(self):
+        channel_id = uuid.uuid4().hex
+        with self.assertRaises(DataError):
+            Channel.objects.create(id=channel_id, name="failed channel", source_url="x" * 201)
+        self.assertFalse(ContentNode.objects.filter(node_id=channel_id).exists())
+
+
+class ChannelStatsTestCase(StudioTestCase):
+    def test_create_records_event(self):
+        with mock.patch("contentcuration.statistics.newrelic.agent.record_custom_event") as record_mock:
+            Channel.objects.create(name="stats channel")
+        record_mock.assert_called_once()
+        params = record_mock.call_args[1]["params"]
+        self.assertEqual(params["action"], "Create")
+        self.assertEqual(params["channel_num_resources"], 0)
+
+    def test_metadata_update_skips_event(self):
+        c = channel()
+        c.description = "updated"
+        with mock.patch("contentcuration.statistics.newrelic.agent.record_custom_event") as record_mock:
+            c.save()
+        record_mock.assert_not_called()
+
+
 class ChannelGettersTestCase(BaseAPITestCase):
     def test_get_channel_thumbnail_default(self):
         default_thumbnail = "/static/img/kolibri_placeholder.png"
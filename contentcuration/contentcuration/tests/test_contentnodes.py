@@ -10,8 +10,10 @@ from builtins import str
 from builtins import zip
 
 import pytest
+from django.db import connection
 from django.db import IntegrityError
 from django.db.utils import DataError
+from django.test.utils import CaptureQueriesContext
 from le_utils.constants import completion_criteria
 from le_utils.constants import content_kinds
 from le_utils.constants import exercises
@@ -383,6 +385,73 @@ class NodeOperationsTestCase(StudioTestCase):
         self.channel.main_tree.refresh_from_db()
         self.assertFalse(self.channel.main_tree.changed)
 
+    def test_with_related(self):
+        """
+        Ensures that related objects read while walking a tree are loaded up front
+        """
+        children = list(self.channel.main_tree.get_children().with_related())
+        self.assertTrue(children)
+        with self.assertNumQueries(0):
+            for child in children:
+                child.kind
+                child.license
+                child.language
+                list(child.tags.all())
+
+    def test_with_publishable(self):
+        """
+        Ensures that the annotated publishable flag matches the per-node query
+        """
+        self.channel.main_tree.get_descendants(include_self=True).update(complete=True)
+        nodes = list(self.channel.main_tree.get_descendants(include_self=True).with_publishable())
+        expected = {node.pk: ContentNode.objects.get(pk=node.pk).is_publishable() for node in nodes}
+        self.assertIn(True, expected.values())
+        with self.assertNumQueries(0):
+            for node in nodes:
+                self.assertEqual(node.is_publishable(), expected[node.pk])
+
+    def test_delete_node_with_tags(self):
+        """
+        Ensures that deleting a node unlinks its tags, keeps the tags themselves,
+        and marks the parent as changed
+        """
+        parent = self.channel.main_tree
+        ContentNode.objects.filter(pk=parent.pk).update(changed=False)
+        node = parent.get_children().first()
+        tag = ContentTag.objects.create(tag_name="delete_test", channel=self.channel)
+        node.tags.add(tag)
+
+        with CaptureQueriesContext(connection) as captured:
+            node.delete()
+
+        # the parent is flagged by a single UPDATE of its changed column, not a full save
+        parent_updates = [
+            query["sql"] for query in captured.captured_queries
+            if query["sql"].startswith('UPDATE "contentcuration_contentnode"') and parent.pk in query["sql"]
+        ]
+        self.assertEqual(len(parent_updates), 1, parent_updates)
+        self.assertTrue(parent_updates[0].startswith('UPDATE "contentcuration_contentnode" SET "changed" = '))
+        self.assertNotIn('"title"', parent_updates[0])
+        self.assertTrue(ContentTag.objects.filter(pk=tag.pk).exists())
+        self.assertFalse(ContentNode.tags.through.objects.filter(contenttag_id=tag.pk).exists())
+        parent.refresh_from_db()
+        self.assertTrue(parent.changed)
+
+    def test_delete_node_recalculates_storage_once(self):
+        """
+        Ensures that deleting a node with several files recalculates the uploader's storage once
+        """
+        user = testdata.user()
+        node = self.channel.main_tree.get_children().first()
+        for _ in range(3):
+            db_file = create_studio_file(b"some content", preset=format_presets.DOCUMENT, ext="pdf")["db_file"]
+            File.objects.filter(pk=db_file.pk).update(contentnode=node, uploaded_by=user)
+
+        with patch("contentcuration.utils.user.calculate_user_storage_task") as task_mock:
+            node.delete()
+
+        task_mock.fetch_or_enqueue.assert_called_once_with(user, user_id=user.id)
+
     def test_duplicate_nodes_with_tags(self):
         """
         Ensures that when we copy nodes with tags they get copied
@@ -918,6 +987,12 @@ class NodeCreationTestCase(StudioTestCase):
                 tag_name=random.sample(string.printable, random.randint(51, 80)),
             )
 
+    def test_content_tag_bulk_upsert(self):
+        existing = ContentTag.objects.create(tag_name="existing", channel=self.channel)
+        tags = ContentTag.bulk_upsert(self.channel, ["existing", "new", "new"])
+        self.assertEqual(sorted(tags.values_list("tag_name", flat=True)), ["existing", "new"])
+        self.assertIn(existing, tags)
+
     def test_create_node_null_complete(self):
         new_obj = ContentNode(kind_id=content_kinds.TOPIC)
         try:
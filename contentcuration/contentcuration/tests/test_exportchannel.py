@@ -543,6 +543,21 @@ class ChannelExportPrerequisiteTestCase(StudioTestCase):
         cc.PrerequisiteContentRelationship.objects.create(target_node=exercise, prerequisite=node1)
         map_prerequisites(node1)
 
+    def test_prerequisites_mapped(self):
+        channel = cc.Channel.objects.create()
+        node1 = cc.ContentNode.objects.create(kind_id="exercise", parent_id=channel.main_tree.pk, complete=True)
+        node2 = cc.ContentNode.objects.create(kind_id="exercise", parent_id=channel.main_tree.pk, complete=True)
+        cc.PrerequisiteContentRelationship.objects.create(target_node=node2, prerequisite=node1)
+        for node in (node1, node2):
+            kolibri_models.ContentNode.objects.create(
+                id=node.node_id, title=node.title, content_id=node.content_id, channel_id=channel.id, kind=node.kind_id
+            )
+
+        map_prerequisites(node1)
+
+        target = kolibri_models.ContentNode.objects.get(id=node2.node_id)
+        self.assertEqual(list(target.has_prerequisite.values_list("id", flat=True)), [node1.node_id])
+
 
 class ChannelExportPublishedData(StudioTestCase):
     def test_fill_published_fields(self):
@@ -1,12 +1,19 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import
 
+import hashlib
 import json
+import os
+import tempfile
 from builtins import str
+from io import BytesIO
 
 import pytest
+from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.test import SimpleTestCase
 from django.urls import reverse_lazy
 from le_utils.constants import content_kinds
 from le_utils.constants import format_presets
@@ -19,9 +26,11 @@ from .testdata import base64encoding
 from .testdata import generated_base64encoding
 from .testdata import srt_subtitle
 from contentcuration.api import write_raw_content_to_storage
+from contentcuration.models import calculate_md5
 from contentcuration.models import ContentNode
 from contentcuration.models import delete_empty_file_reference
 from contentcuration.models import File
+from contentcuration.models import FileOnDiskStorage
 from contentcuration.models import generate_object_storage_name
 from contentcuration.utils.files import create_thumbnail_from_base64
 from contentcuration.utils.files import get_thumbnail_encoding
@@ -90,3 +99,59 @@ class NodeFileDeletionTestCase(StudioTestCase):
         assert default_storage.exists(storage_path), "file should be saved"
         delete_empty_file_reference(checksum, "pdf")
         assert not default_storage.exists(storage_path), "file should be deleted"
+
+
+class FileHashingTestCase(StudioTestCase):
+    def test_save_sets_checksum_and_size(self):
+        contents = b"some fake PDF data" * 100000
+        f = File(file_on_disk=SimpleUploadedFile("file.pdf", contents))
+        f.save()
+        self.assertEqual(f.checksum, hashlib.md5(contents).hexdigest())
+        self.assertEqual(f.file_size, len(contents))
+
+    def test_save_reuses_stored_copy(self):
+        contents = b"some duplicated PDF data"
+        first = File(file_on_disk=SimpleUploadedFile("first.pdf", contents))
+        first.save()
+        second = File(file_on_disk=SimpleUploadedFile("second.pdf", contents))
+        with patch.object(default_storage, "save") as save_mock:
+            second.save()
+        save_mock.assert_not_called()
+        self.assertEqual(second.file_on_disk.name, first.file_on_disk.name)
+
+    @override_settings(TRUST_CLIENT_CHECKSUMS=True)
+    def test_save_trusts_checksum_filename(self):
+        checksum = "a" * 32
+        f = File(file_on_disk=SimpleUploadedFile("{}.pdf".format(checksum), b"some fake PDF data"))
+        with patch("contentcuration.models.calculate_md5") as calculate_md5_mock:
+            f.save()
+        calculate_md5_mock.assert_not_called()
+        self.assertEqual(f.checksum, checksum)
+        self.assertEqual(f.file_size, len(b"some fake PDF data"))
+
+    def test_calculate_md5_reads_from_start(self):
+        contents = b"some fake PDF data"
+        fobj = BytesIO(contents)
+        fobj.seek(5)
+        self.assertEqual(calculate_md5(fobj), (hashlib.md5(contents).hexdigest(), len(contents)))
+
+
+class FileOnDiskStorageTestCase(SimpleTestCase):
+    def test_save_keeps_existing_copy(self):
+        with tempfile.TemporaryDirectory() as location:
+            storage = FileOnDiskStorage(location=location)
+            name = storage.save("a/b/abc.pdf", ContentFile(b"original"))
+            self.assertEqual(storage.save("a/b/abc.pdf", ContentFile(b"duplicate")), name)
+            with storage.open(name) as f:
+                self.assertEqual(f.read(), b"original")
+
+    def test_save_applies_permissions(self):
+        with tempfile.TemporaryDirectory() as location:
+            storage = FileOnDiskStorage(
+                location=location, file_permissions_mode=0o640, directory_permissions_mode=0o750
+            )
+            name = storage.save("a/b/abc.txt", ContentFile("text content"))
+            self.assertEqual(os.stat(storage.path(name)).st_mode & 0o777, 0o640)
+            self.assertEqual(os.stat(storage.path("a/b")).st_mode & 0o777, 0o750)
+            with storage.open(name) as f:
+                self.assertEqual(f.read(), b"text content")
@@ -15,6 +15,7 @@ from le_utils.constants import file_formats
 from le_utils.constants import format_presets
 from le_utils.constants import languages
 from le_utils.constants import licenses
+from mock import patch
 
 from .base import StudioTestCase
 from contentcuration.models import ContentKind
@@ -24,6 +25,7 @@ from contentcuration.models import FormatPreset
 from contentcuration.models import generate_object_storage_name
 from contentcuration.models import Language
 from contentcuration.models import License
+from contentcuration.utils.files import create_file_from_contents
 from contentcuration.utils.files import get_file_diff
 
 
@@ -73,6 +75,18 @@ class GetFileDiffTestCase(StudioTestCase):
         assert get_file_diff(files) == ["rando"]
 
 
+class CreateFileFromContentsTestCase(StudioTestCase):
+    def test_file_size_from_contents(self):
+        """
+        Test that the file size is taken from the contents rather than read back from storage
+        """
+        contents = b"some fake PNG data"
+        with patch.object(default_storage, "size") as size_mock:
+            f = create_file_from_contents(contents, ext="png", preset_id=format_presets.CHANNEL_THUMBNAIL)
+        size_mock.assert_not_called()
+        self.assertEqual(f.file_size, len(contents))
+
+
 class FileFormatsTestCase(StudioTestCase):
     """
     Ensure that unsupported files aren't saved.
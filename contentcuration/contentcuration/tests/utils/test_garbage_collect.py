@@ -241,6 +241,8 @@ class CleanUpContentNodesTestCase(StudioTestCase):
 
         # there should be no file object in the DB
         assert File.objects.count() == 0
+        # but the file is kept in storage, as it may be referenced outside of the DB
+        requests.head(file_url).raise_for_status()
 
     def test_doesnt_delete_shared_files(self):
         """
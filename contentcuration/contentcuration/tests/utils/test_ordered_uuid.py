@@ -0,0 +1,18 @@
+import mock
+from django.test import SimpleTestCase
+
+from contentcuration.utils.ordered_uuid import uuid7
+
+
+class UUID7TestCase(SimpleTestCase):
+    def test_version_and_variant(self):
+        value = uuid7()
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, "specified in RFC 4122")
+
+    def test_ordered_by_time(self):
+        with mock.patch("contentcuration.utils.ordered_uuid.time.time_ns", return_value=1000000000):
+            first = uuid7()
+        with mock.patch("contentcuration.utils.ordered_uuid.time.time_ns", return_value=2000000000):
+            second = uuid7()
+        self.assertLess(first.hex, second.hex)
@@ -276,6 +276,12 @@ class ApiAddNodesToTreeTestCase(StudioTestCase):
 
         self.assertEqual(response.status_code, 400, response.content)
 
+    def test_license_lookup_cached(self):
+        internal._get_license.cache_clear()
+        license = internal._get_license("cc by")
+        with self.assertNumQueries(0):
+            self.assertEqual(internal._get_license("cc by"), license)
+
 
 class ApiAddExerciseNodesToTreeTestCase(StudioTestCase):
     """
@@ -28,7 +28,7 @@ def create_file_from_contents(contents, ext=None, node=None, preset_id=None, upl
 
     result = File(
         file_format_id=ext,
-        file_size=default_storage.size(path),
+        file_size=len(contents),
         checksum=checksum,
         preset_id=preset_id,
         contentnode=node,
@@ -7,10 +7,8 @@ import logging
 
 from celery import states
 from django.conf import settings
-from django.core.files.storage import default_storage
 from django.db.models import Subquery
 from django.db.models.expressions import CombinedExpression
-from django.db.models.expressions import Exists
 from django.db.models.expressions import F
 from django.db.models.expressions import OuterRef
 from django.db.models.expressions import Value
@@ -51,17 +49,12 @@ def get_deleted_chefs_root():
 
 def _clean_up_files(contentnode_ids):
     """
-    Clean up the files (both in the DB and in object storage)
-    associated with the `contentnode_ids` iterable that are
-    not pointed by any other contentnode.
+    Clean up the files in the DB associated with the `contentnode_ids` iterable.
+
+    Files are left in object storage: we cannot yet ensure they are not referenced
+    anywhere else, such as by exported channel databases, which only hold checksums.
     """
     files = File.objects.filter(contentnode__in=contentnode_ids)
-    files_on_storage = files.values_list("file_on_disk", flat=True)
-
-    for disk_file_path in files_on_storage:
-        is_other_node_pointing = Exists(File.objects.filter(file_on_disk=disk_file_path).exclude(contentnode__in=contentnode_ids))
-        if not is_other_node_pointing:
-            default_storage.delete(disk_file_path)
 
     # use _raw_delete for much fast file deletions
     files._raw_delete(files.db)
@@ -285,8 +285,10 @@ def download_file(filename, download_url=None, contentnode=None, assessment_item
         for chunk in response:
             buffer.write(chunk)
 
-        checksum, _, filepath = write_raw_content_to_storage(buffer.getvalue(), ext=extension)
+        contents = buffer.getvalue()
         buffer.close()
+        file_size = file_size or len(contents)
+        checksum, _, filepath = write_raw_content_to_storage(contents, ext=extension)
 
     # Save values to new file object
     file_obj = models.File(
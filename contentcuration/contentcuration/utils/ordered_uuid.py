@@ -0,0 +1,23 @@
+import os
+import time
+import uuid
+
+
+def uuid7():
+    """
+    Generate a time-ordered UUID, following the version 7 layout from RFC 9562:
+    a 48 bit unix timestamp in milliseconds followed by 74 random bits.
+
+    Consecutively generated values sort close together, so inserting them as primary keys
+    appends to the right-hand side of the B-tree index instead of splitting random pages.
+    :return: uuid.UUID
+    """
+    timestamp_ms = time.time_ns() // 1000000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (timestamp_ms & 0xFFFFFFFFFFFF) << 80
+    # version 7 in bits 76-79, 12 random bits, then the RFC 4122 variant and 62 random bits
+    value |= 0x7 << 76
+    value |= ((rand >> 62) & 0xFFF) << 64
+    value |= 0x2 << 62
+    value |= rand & 0x3FFFFFFFFFFFFFFF
+    return uuid.UUID(int=value)
@@ -26,7 +26,6 @@ from django.db.models import OuterRef
 from django.db.models import Q
 from django.db.models import Subquery
 from django.db.models import Sum
-from django.db.utils import IntegrityError
 from django.template.loader import render_to_string
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -265,7 +264,7 @@ class TreeMapper:
             elif node.kind_id == content_kinds.SLIDESHOW:
                 create_slideshow_manifest(node, user_id=self.user_id)
             elif node.kind_id == content_kinds.TOPIC:
-                for child in node.children.all():
+                for child in node.children.all().with_related().with_publishable():
                     self.recurse_nodes(child, metadata)
             create_associated_file_objects(kolibrinode, node)
             map_tags_to_node(kolibrinode, node)
@@ -441,7 +440,9 @@ def create_associated_thumbnail(ccnode, ccfilemodel):
 
 def create_associated_file_objects(kolibrinode, ccnode):
     logging.debug("Creating LocalFile and File objects for Node {}".format(kolibrinode.id))
-    for ccfilemodel in ccnode.files.exclude(Q(preset_id=format_presets.EXERCISE_IMAGE) | Q(preset_id=format_presets.EXERCISE_GRAPHIE)):
+    files = ccnode.files.exclude(Q(preset_id=format_presets.EXERCISE_IMAGE) | Q(preset_id=format_presets.EXERCISE_GRAPHIE))\
+        .select_related("preset", "file_format", "language")
+    for ccfilemodel in files:
         preset = ccfilemodel.preset
         fformat = ccfilemodel.file_format
         if ccfilemodel.language:
@@ -717,16 +718,26 @@ def process_image_strings(content, zf, channel_id):
 
 
 def map_prerequisites(root_node):
+    prerequisites = ccmodels.PrerequisiteContentRelationship.objects.filter(prerequisite__tree_id=root_node.tree_id)\
+        .values_list('target_node__node_id', 'prerequisite__node_id')
+    if not prerequisites:
+        return
 
-    for n in ccmodels.PrerequisiteContentRelationship.objects.filter(prerequisite__tree_id=root_node.tree_id)\
-            .values('prerequisite__node_id', 'target_node__node_id'):
-        try:
-            target_node = kolibrimodels.ContentNode.objects.get(pk=n['target_node__node_id'])
-            target_node.has_prerequisite.add(n['prerequisite__node_id'])
-        except kolibrimodels.ContentNode.DoesNotExist as e:
-            logging.error('Unable to find prerequisite {}'.format(str(e)))
-        except IntegrityError as e:
-            logging.error('Unable to find source node for prerequisite relationship {}'.format(str(e)))
+    # Look up the exported nodes and insert the relationships in bulk, rather than
+    # issuing a lookup and an insert for every relationship
+    node_ids = {t for t, _ in prerequisites} | {p for _, p in prerequisites}
+    exported_node_ids = set(kolibrimodels.ContentNode.objects.filter(id__in=node_ids).values_list('id', flat=True))
+    through_model = kolibrimodels.ContentNode.has_prerequisite.through
+    relationships = []
+    for target_node_id, prerequisite_id in prerequisites:
+        if target_node_id not in exported_node_ids:
+            logging.error('Unable to find prerequisite target node {}'.format(target_node_id))
+        elif prerequisite_id not in exported_node_ids:
+            logging.error('Unable to find source node {} for prerequisite relationship'.format(prerequisite_id))
+        else:
+            relationships.append(through_model(from_contentnode_id=target_node_id, to_contentnode_id=prerequisite_id))
+
+    through_model.objects.bulk_create(relationships, ignore_conflicts=True)
 
 
 def map_channel_to_kolibri_channel(channel):
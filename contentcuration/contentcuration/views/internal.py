@@ -3,6 +3,7 @@ import logging
 from builtins import str
 from collections import namedtuple
 from distutils.version import LooseVersion
+from functools import lru_cache
 
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.exceptions import PermissionDenied
@@ -548,21 +549,14 @@ class IncompleteNodeError(Exception):
 
 
 def add_tags(node, node_data):
-    tags = []
-    channel = node.get_channel()
-    if "tags" in node_data:
-        tag_data = node_data["tags"]
-        if tag_data is not None:
-            for tag in tag_data:
-                if len(tag) > 30:
-                    raise ValidationError("tag is greater than 30 characters")
-                else:
-                    tags.append(
-                        ContentTag.objects.get_or_create(tag_name=tag, channel=channel)[0]
-                    )
-
-    if len(tags) > 0:
-        node.tags.add(*tags)
+    tag_data = node_data.get("tags")
+    if not tag_data:
+        return
+    for tag in tag_data:
+        if len(tag) > 30:
+            raise ValidationError("tag is greater than 30 characters")
+
+    node.tags.add(*ContentTag.bulk_upsert(node.get_channel(), tag_data))
 
 
 def validate_metadata_labels(node_data):
@@ -640,10 +634,13 @@ def convert_data_to_nodes(user, content_data, parent_node):  # noqa: C901
         if parent_node.kind_id != content_kinds.TOPIC:
             raise NodeValidationError("Parent node must be a topic/folder | actual={}".format(parent_node.kind_id))
 
-        sort_order = parent_node.children.count() + 1
-        existing_node_ids = ContentNode.objects.filter(
+        # Fetch the existing children once, both to count them and to check for duplicates
+        # in constant time, as a ricecooker folder can contain thousands of nodes
+        child_node_ids = list(ContentNode.objects.filter(
             parent_id=parent_node.pk
-        ).values_list("node_id", flat=True)
+        ).values_list("node_id", flat=True))
+        sort_order = len(child_node_ids) + 1
+        existing_node_ids = set(child_node_ids)
         with transaction.atomic():
             for node_data in content_data:
                 # Check if node id is already in the tree to avoid duplicates
@@ -712,6 +709,12 @@ METADATA = {
 }
 
 
+@lru_cache(maxsize=None)
+def _get_license(license_name):
+    """ Licenses are loaded as fixed constants, so they can be cached for the life of the process """
+    return License.objects.get(license_name__iexact=license_name)
+
+
 def create_node(node_data, parent_node, sort_order):  # noqa: C901
     """ Generate node based on node dict """
     # Make sure license is valid
@@ -719,7 +722,7 @@ def create_node(node_data, parent_node, sort_order):  # noqa: C901
     license_name = node_data["license"]
     if license_name is not None:
         try:
-            license = License.objects.get(license_name__iexact=license_name)
+            license = _get_license(license_name.lower())
         except ObjectDoesNotExist:
             raise ObjectDoesNotExist("Invalid license found")
 
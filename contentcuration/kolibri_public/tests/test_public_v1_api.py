@@ -3,7 +3,9 @@ from __future__ import absolute_import
 from django.conf import settings
 from django.core.cache import cache
 from django.urls import reverse
+from kolibri_public.views_v1 import _get_channel_list_v1
 
+from contentcuration.serializers import PublicChannelSerializer
 from contentcuration.tests.base import BaseAPITestCase
 from contentcuration.tests.testdata import generated_base64encoding
 
@@ -74,3 +76,21 @@ class PublicAPITestCase(BaseAPITestCase):
         self.assertEqual(first_channel["name"], self.channel.name)
         self.assertEqual(first_channel["id"], self.channel.id)
         self.assertEqual(first_channel["icon_encoding"], generated_base64encoding())
+
+    def test_public_channels_only_loads_serialized_fields(self):
+        """
+        Test that the public channel list defers unused fields, without the serializer
+        having to load any of the deferred fields for each channel.
+        """
+        self.channel.public = True
+        self.channel.main_tree.published = True
+        self.channel.main_tree.save()
+        self.channel.save()
+
+        channels = list(_get_channel_list_v1({}))
+        self.assertEqual(len(channels), 1)
+        self.assertIn("thumbnail", channels[0].get_deferred_fields())
+
+        # one query each for the matching tokens and the included languages
+        with self.assertNumQueries(2):
+            PublicChannelSerializer(channels, many=True).data
@@ -27,6 +27,26 @@ def _get_channel_list(version, params, identifier=None):
     raise LookupError()
 
 
+# Columns read by PublicChannelSerializer, so that wide fields it does not use,
+# such as the channel preferences and content defaults, are not loaded for every channel
+PUBLIC_CHANNEL_FIELDS = (
+    "id",
+    "name",
+    "language",
+    "description",
+    "total_resource_count",
+    "version",
+    "published_kind_count",
+    "published_size",
+    "published_data",
+    "last_published",
+    "icon_encoding",
+    "thumbnail_encoding",
+    "public",
+    "priority",
+)
+
+
 def _get_channel_list_v1(params, identifier=None):
     keyword = params.get('keyword', '').strip()
     language_id = params.get('language', '').strip()
@@ -49,6 +69,7 @@ def _get_channel_list_v1(params, identifier=None):
 
     return channels.annotate(tokens=Value(json.dumps(token_list), output_field=TextField()))\
         .filter(deleted=False, main_tree__published=True)\
+        .only(*PUBLIC_CHANNEL_FIELDS)\
         .order_by("-priority")\
         .distinct()
 